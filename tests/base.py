@@ -6,6 +6,7 @@ import io
 import os
 import sys
 from collections import namedtuple
+from functools import lru_cache
 
 from argh import ArghParser
 
@@ -26,9 +27,15 @@ class DebugArghParser(ArghParser):
         self.exit(2, message)
 
 
+@lru_cache(maxsize=256)
+def _split_cmd(command_string):
+    return tuple(command_string.split())
+
+
 def call_cmd(parser, command_string, **kwargs):
     if hasattr(command_string, "split"):
-        args = command_string.split()
+        # a fresh list each time: `dispatch()` may mutate argv in place
+        args = list(_split_cmd(command_string))
     else:
         args = command_string
 
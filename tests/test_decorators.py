@@ -5,6 +5,13 @@ Unit Tests For Decorators
 import pytest
 
 import argh
+from argh.constants import (
+    ATTR_ALIASES,
+    ATTR_ARGS,
+    ATTR_NAME,
+    ATTR_WRAPPED_EXCEPTIONS,
+    ATTR_WRAPPED_EXCEPTIONS_PROCESSOR,
+)
 from argh.dto import ParserAddArgumentSpec
 from argh.utils import (
     CliArgToFuncArgGuessingError,
@@ -14,13 +21,21 @@ from argh.utils import (
 )
 
 
-def test_aliases():
-    @argh.aliases("one", "two")
-    def func():
-        pass
-
-    attr = getattr(func, argh.constants.ATTR_ALIASES)
-    assert attr == ("one", "two")
+EXPECTED_ARG_SPECS = [
+    ParserAddArgumentSpec(
+        func_arg_name="foo",
+        cli_arg_names=["foo"],
+        nargs="+",
+        other_add_parser_kwargs={
+            "help": "my help",
+        },
+    ),
+    ParserAddArgumentSpec(
+        func_arg_name="bar",
+        cli_arg_names=["--bar"],
+        default_value=1,
+    ),
+]
 
 
 def test_arg():
@@ -29,49 +44,29 @@ def test_arg():
     def func():
         pass
 
-    attrs = getattr(func, argh.constants.ATTR_ARGS)
-    assert attrs == [
-        ParserAddArgumentSpec(
-            func_arg_name="foo",
-            cli_arg_names=["foo"],
-            nargs="+",
-            other_add_parser_kwargs={
-                "help": "my help",
-            },
-        ),
-        ParserAddArgumentSpec(
-            func_arg_name="bar",
-            cli_arg_names=["--bar"],
-            default_value=1,
-        ),
-    ]
-
+    attrs = getattr(func, ATTR_ARGS)
+    assert attrs == EXPECTED_ARG_SPECS
 
-def test_named():
-    @argh.named("new-name")
-    def func():
-        pass
 
-    attr = getattr(func, argh.constants.ATTR_NAME)
-    assert attr == "new-name"
-
-
-def test_wrap_errors():
-    @argh.wrap_errors([KeyError, ValueError])
-    def func():
-        pass
-
-    attr = getattr(func, argh.constants.ATTR_WRAPPED_EXCEPTIONS)
-    assert attr == [KeyError, ValueError]
+def test_decorator_attrs():
+    cases = [
+        (argh.aliases("one", "two"), ATTR_ALIASES, ("one", "two")),
+        (argh.named("new-name"), ATTR_NAME, "new-name"),
+        (
+            argh.wrap_errors([KeyError, ValueError]),
+            ATTR_WRAPPED_EXCEPTIONS,
+            [KeyError, ValueError],
+        ),
+        (argh.wrap_errors(processor="STUB"), ATTR_WRAPPED_EXCEPTIONS_PROCESSOR, "STUB"),
+    ]
+    for decorator, attr_name, expected in cases:
 
+        def func():
+            pass
 
-def test_wrap_errors_processor():
-    @argh.wrap_errors(processor="STUB")
-    def func():
-        pass
+        func = decorator(func)
 
-    attr = getattr(func, argh.constants.ATTR_WRAPPED_EXCEPTIONS_PROCESSOR)
-    assert attr == "STUB"
+        assert getattr(func, attr_name) == expected, attr_name
 
 
 def test_naive_guess_func_arg_name() -> None:
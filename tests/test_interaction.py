@@ -7,28 +7,26 @@ import unittest.mock as mock
 import argh
 
 
-def parse_choice(choice, **kwargs):
-    with mock.patch("argh.interaction.input", lambda prompt: choice):
-        return argh.confirm("test", **kwargs)
-
-
-def test_simple():
-    assert parse_choice("") is None
-    assert parse_choice("", default=None) is None
-    assert parse_choice("", default=True) is True
-    assert parse_choice("", default=False) is False
-
-    assert parse_choice("y") is True
-    assert parse_choice("y", default=True) is True
-    assert parse_choice("y", default=False) is True
-    assert parse_choice("y", default=None) is True
-
-    assert parse_choice("n") is False
-    assert parse_choice("n", default=True) is False
-    assert parse_choice("n", default=False) is False
-    assert parse_choice("n", default=None) is False
-
-    assert parse_choice("x") is None
+@mock.patch("argh.interaction.input")
+def test_simple(mock_input):
+    cases = [
+        ("", {}, None),
+        ("", {"default": None}, None),
+        ("", {"default": True}, True),
+        ("", {"default": False}, False),
+        ("y", {}, True),
+        ("y", {"default": True}, True),
+        ("y", {"default": False}, True),
+        ("y", {"default": None}, True),
+        ("n", {}, False),
+        ("n", {"default": True}, False),
+        ("n", {"default": False}, False),
+        ("n", {"default": None}, False),
+        ("x", {}, None),
+    ]
+    for choice, kwargs, expected in cases:
+        mock_input.return_value = choice
+        assert argh.confirm("test", **kwargs) is expected, (choice, kwargs)
 
 
 def test_prompt():